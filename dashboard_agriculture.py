@@ -14,6 +14,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from collections import namedtuple
 from datetime import datetime
 
 # ============================================================
@@ -29,7 +30,7 @@ st.set_page_config(
 # ============================================================
 # CUSTOM CSS FOR BRANDING
 # ============================================================
-st.markdown("""
+_CSS = """
     <style>
     .main {
         background-color: #fffef9;
@@ -67,6 +68,11 @@ st.markdown("""
         border-left: 4px solid #c17a5c;
         margin: 10px 0;
     }
+    .opportunity-grid {
+        display: grid;
+        grid-template-columns: 1fr;
+        gap: 10px;
+    }
     .opportunity-card {
         background-color: white;
         padding: 20px;
@@ -74,6 +80,9 @@ st.markdown("""
         border: 2px solid #d4a574;
         margin: 10px 0;
     }
+    .opportunity-card .tags {
+        margin: 10px 0;
+    }
     .investment-tag {
         display: inline-block;
         padding: 5px 15px;
@@ -88,227 +97,312 @@ st.markdown("""
         gap: 1rem;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+@st.cache_resource
+def get_css() -> str:
+    """Page stylesheet, cached so reruns reuse the same string object."""
+    return _CSS
+
+st.markdown(get_css(), unsafe_allow_html=True)
+
+# ============================================================
+# BASE TABLE ARRAYS (SoA: one contiguous NumPy array per column)
+# ============================================================
+
+_YEARS = np.arange(2019, 2024)
+
+# ZAMBIA - Major crops (metric tons), 5 years per crop
+_ZAMBIA_CROPS = np.array([
+    'Maize', 'Soybean', 'Wheat', 'Cotton',
+    'Groundnuts', 'Sunflower', 'Sweet Potato', 'Cassava'
+])
+_ZAMBIA_PROD = np.array([
+    # Maize (largest crop)
+    3200000, 2500000, 3800000, 3500000, 3600000,
+    # Soybean (growing export crop)
+    350000, 380000, 420000, 450000, 480000,
+    # Wheat
+    250000, 280000, 300000, 320000, 340000,
+    # Cotton
+    180000, 160000, 200000, 220000, 240000,
+    # Groundnuts
+    120000, 130000, 140000, 150000, 160000,
+    # Sunflower
+    80000, 85000, 90000, 95000, 100000,
+    # Sweet Potato
+    900000, 920000, 950000, 980000, 1000000,
+    # Cassava
+    1200000, 1250000, 1300000, 1350000, 1400000
+], dtype=np.int64)
+_ZAMBIA_AREA = np.array([
+    # Maize
+    1200000, 1100000, 1300000, 1250000, 1280000,
+    # Soybean
+    180000, 200000, 220000, 240000, 260000,
+    # Wheat
+    85000, 90000, 95000, 100000, 105000,
+    # Cotton
+    120000, 110000, 130000, 140000, 150000,
+    # Groundnuts
+    180000, 185000, 190000, 195000, 200000,
+    # Sunflower
+    45000, 47000, 49000, 51000, 53000,
+    # Sweet Potato
+    80000, 82000, 84000, 86000, 88000,
+    # Cassava
+    280000, 285000, 290000, 295000, 300000
+], dtype=np.int64)
+
+# BOTSWANA - Major crops (metric tons - smaller scale), 5 years per crop
+_BOTSWANA_CROPS = np.array(['Sorghum', 'Maize', 'Millet', 'Beans', 'Groundnuts'])
+_BOTSWANA_PROD = np.array([
+    # Sorghum (main cereal)
+    25000, 18000, 30000, 28000, 32000,
+    # Maize
+    8000, 6000, 10000, 9000, 11000,
+    # Millet
+    3000, 2500, 3500, 3200, 3800,
+    # Beans
+    2500, 2200, 2800, 2600, 3000,
+    # Groundnuts
+    1800, 1600, 2000, 1900, 2200
+], dtype=np.int64)
+_BOTSWANA_AREA = np.array([
+    # Sorghum
+    85000, 80000, 90000, 88000, 92000,
+    # Maize
+    25000, 22000, 28000, 26000, 30000,
+    # Millet
+    15000, 13000, 16000, 15000, 17000,
+    # Beans
+    8000, 7500, 8500, 8200, 9000,
+    # Groundnuts
+    7000, 6500, 7500, 7200, 8000
+], dtype=np.int64)
+
+# Full production columns, stacked Zambia-then-Botswana at import time so
+# the loader builds its frame from one ready-made column dict
+_PROD_YEAR_COL = np.concatenate([
+    np.tile(_YEARS, len(_ZAMBIA_CROPS)),
+    np.tile(_YEARS, len(_BOTSWANA_CROPS))
+])
+_PROD_COUNTRY_COL = np.concatenate([
+    np.repeat('Zambia', len(_ZAMBIA_PROD)),
+    np.repeat('Botswana', len(_BOTSWANA_PROD))
+])
+_PROD_CROP_COL = np.concatenate([
+    np.repeat(_ZAMBIA_CROPS, len(_YEARS)),
+    np.repeat(_BOTSWANA_CROPS, len(_YEARS))
+])
+_PROD_MT_COL = np.concatenate([_ZAMBIA_PROD, _BOTSWANA_PROD])
+_PROD_AREA_COL = np.concatenate([_ZAMBIA_AREA, _BOTSWANA_AREA])
+
+# TRADE - Value in USD millions, 5 years per category
+_ZAMBIA_TRADE_CATEGORIES = np.array([
+    'Maize Exports', 'Wheat Imports', 'Soybean Exports', 'Cotton Exports',
+    'Processed Foods Imports', 'Vegetable Oil Imports'
+])
+_BOTSWANA_TRADE_CATEGORIES = np.array([
+    'Maize Imports', 'Wheat Imports', 'Meat Imports', 'Dairy Imports',
+    'Processed Foods Imports', 'Vegetable Oil Imports'
+])
+_TRADE_VALUES = np.array([
+    # ZAMBIA
+    # Maize Exports
+    120, 80, 180, 150, 160,
+    # Wheat Imports
+    95, 105, 110, 120, 130,
+    # Soybean Exports
+    45, 50, 60, 70, 80,
+    # Cotton Exports
+    30, 25, 35, 40, 45,
+    # Processed Foods Imports
+    250, 260, 280, 300, 320,
+    # Vegetable Oil Imports
+    65, 70, 75, 80, 85,
+
+    # BOTSWANA
+    # Maize Imports
+    180, 200, 190, 210, 220,
+    # Wheat Imports
+    85, 90, 95, 100, 105,
+    # Meat Imports
+    120, 130, 140, 150, 160,
+    # Dairy Imports
+    95, 100, 105, 110, 115,
+    # Processed Foods Imports
+    450, 480, 510, 540, 570,
+    # Vegetable Oil Imports
+    45, 48, 51, 54, 57
+], dtype=np.int64)
+
+# PROCESSING CAPACITY - one row per facility type per country
+_CAPACITY_TYPES = np.array([
+    'Maize Milling', 'Wheat Milling', 'Vegetable Oil Extraction',
+    'Cotton Ginning', 'Dairy Processing', 'Meat Processing',
+    'Maize Milling', 'Dairy Processing', 'Meat Processing', 'Vegetable Processing'
+])
+_CAPACITY_FACILITIES = np.array([85, 12, 8, 15, 25, 35, 8, 5, 12, 4], dtype=np.int64)
+_CAPACITY_TOTAL = np.array([
+    2500000, 400000, 150000, 200000, 180000, 250000,
+    80000, 50000, 120000, 15000
+], dtype=np.int64)
+_CAPACITY_UTILIZATION = np.array([75, 60, 45, 70, 65, 80, 55, 70, 85, 40], dtype=np.int64)
+_CAPACITY_POTENTIAL = np.array([
+    'Medium', 'High', 'Very High', 'Medium', 'High', 'Medium',
+    'High', 'Medium', 'Low', 'Very High'
+])
+# Integer division is exact here (capacities are multiples of 100) and
+# keeps the column in the same int64 block as the other capacity fields
+_CAPACITY_UNUTILIZED = _CAPACITY_TOTAL * (100 - _CAPACITY_UTILIZATION) // 100
 
 # ============================================================
 # DATA LOADING FUNCTIONS
 # ============================================================
 
-@st.cache_data
+@st.cache_resource
 def load_production_data():
     """
     Agricultural production data for Botswana and Zambia
     Data sources: FAO, National Agricultural Statistics
+
+    Built column-wise from the module-level arrays so each numeric column
+    lands in a single contiguous block - no per-row boxing, no concat copy.
+
+    Cached as a shared resource: the returned frame is a single instance
+    reused across reruns and must be treated as read-only.
     """
-    
-    # Major crops by country with production trends (2019-2023)
-    years = list(range(2019, 2024))
-    
-    # ZAMBIA - Major crops (metric tons)
-    zambia_data = {
-        'Year': years * 8,  # 5 years × 8 crops
-        'Country': ['Zambia'] * 40,
-        'Crop': (
-            ['Maize'] * 5 + ['Soybean'] * 5 + ['Wheat'] * 5 + ['Cotton'] * 5 +
-            ['Groundnuts'] * 5 + ['Sunflower'] * 5 + ['Sweet Potato'] * 5 + ['Cassava'] * 5
-        ),
-        'Production_MT': [
-            # Maize (largest crop)
-            3200000, 2500000, 3800000, 3500000, 3600000,
-            # Soybean (growing export crop)
-            350000, 380000, 420000, 450000, 480000,
-            # Wheat
-            250000, 280000, 300000, 320000, 340000,
-            # Cotton
-            180000, 160000, 200000, 220000, 240000,
-            # Groundnuts
-            120000, 130000, 140000, 150000, 160000,
-            # Sunflower
-            80000, 85000, 90000, 95000, 100000,
-            # Sweet Potato
-            900000, 920000, 950000, 980000, 1000000,
-            # Cassava
-            1200000, 1250000, 1300000, 1350000, 1400000
-        ],
-        'Area_Hectares': [
-            # Maize
-            1200000, 1100000, 1300000, 1250000, 1280000,
-            # Soybean
-            180000, 200000, 220000, 240000, 260000,
-            # Wheat
-            85000, 90000, 95000, 100000, 105000,
-            # Cotton
-            120000, 110000, 130000, 140000, 150000,
-            # Groundnuts
-            180000, 185000, 190000, 195000, 200000,
-            # Sunflower
-            45000, 47000, 49000, 51000, 53000,
-            # Sweet Potato
-            80000, 82000, 84000, 86000, 88000,
-            # Cassava
-            280000, 285000, 290000, 295000, 300000
-        ]
-    }
-    
-    # BOTSWANA - Major crops (metric tons - smaller scale)
-    botswana_data = {
-        'Year': years * 5,  # 5 years × 5 crops
-        'Country': ['Botswana'] * 25,
-        'Crop': (
-            ['Sorghum'] * 5 + ['Maize'] * 5 + ['Millet'] * 5 + 
-            ['Beans'] * 5 + ['Groundnuts'] * 5
-        ),
-        'Production_MT': [
-            # Sorghum (main cereal)
-            25000, 18000, 30000, 28000, 32000,
-            # Maize
-            8000, 6000, 10000, 9000, 11000,
-            # Millet
-            3000, 2500, 3500, 3200, 3800,
-            # Beans
-            2500, 2200, 2800, 2600, 3000,
-            # Groundnuts
-            1800, 1600, 2000, 1900, 2200
-        ],
-        'Area_Hectares': [
-            # Sorghum
-            85000, 80000, 90000, 88000, 92000,
-            # Maize
-            25000, 22000, 28000, 26000, 30000,
-            # Millet
-            15000, 13000, 16000, 15000, 17000,
-            # Beans
-            8000, 7500, 8500, 8200, 9000,
-            # Groundnuts
-            7000, 6500, 7500, 7200, 8000
-        ]
-    }
-    
-    df_zambia = pd.DataFrame(zambia_data)
-    df_botswana = pd.DataFrame(botswana_data)
-    df = pd.concat([df_zambia, df_botswana], ignore_index=True)
-    
+
+    df = pd.DataFrame({
+        'Year': _PROD_YEAR_COL,
+        'Country': _PROD_COUNTRY_COL,
+        'Crop': _PROD_CROP_COL,
+        'Production_MT': _PROD_MT_COL,
+        'Area_Hectares': _PROD_AREA_COL
+    }, copy=False)
+
     # Calculate yield (MT per hectare)
-    df['Yield_MT_per_Ha'] = df['Production_MT'] / df['Area_Hectares']
-    
+    df['Yield_MT_per_Ha'] = _PROD_MT_COL / _PROD_AREA_COL
+
+    # Filter/groupby keys as categoricals: isin and groupby then work on
+    # integer codes instead of hashing Python strings
+    for col in ('Country', 'Crop'):
+        df[col] = df[col].astype('category')
+
     return df
 
-@st.cache_data
+@st.cache_resource
 def load_trade_data():
     """
     Agricultural trade data - imports/exports
     Source: International Trade Centre (ITC), National Statistics
+
+    Cached as a shared resource: the returned frame is a single instance
+    reused across reruns and must be treated as read-only.
     """
-    
-    years = list(range(2019, 2024))
-    
-    trade_data = {
-        'Year': years * 12,  # 5 years × 12 categories (6 per country)
-        'Country': ['Zambia']*30 + ['Botswana']*30,
-        'Category': (
-            ['Maize Exports', 'Wheat Imports', 'Soybean Exports', 'Cotton Exports', 
-             'Processed Foods Imports', 'Vegetable Oil Imports'] * 5 +
-            ['Maize Imports', 'Wheat Imports', 'Meat Imports', 'Dairy Imports',
-             'Processed Foods Imports', 'Vegetable Oil Imports'] * 5
-        ),
-        'Value_USD_Millions': [
-            # ZAMBIA
-            # Maize Exports
-            120, 80, 180, 150, 160,
-            # Wheat Imports
-            95, 105, 110, 120, 130,
-            # Soybean Exports
-            45, 50, 60, 70, 80,
-            # Cotton Exports
-            30, 25, 35, 40, 45,
-            # Processed Foods Imports
-            250, 260, 280, 300, 320,
-            # Vegetable Oil Imports
-            65, 70, 75, 80, 85,
-            
-            # BOTSWANA
-            # Maize Imports
-            180, 200, 190, 210, 220,
-            # Wheat Imports
-            85, 90, 95, 100, 105,
-            # Meat Imports
-            120, 130, 140, 150, 160,
-            # Dairy Imports
-            95, 100, 105, 110, 115,
-            # Processed Foods Imports
-            450, 480, 510, 540, 570,
-            # Vegetable Oil Imports
-            45, 48, 51, 54, 57
-        ]
-    }
-    
-    return pd.DataFrame(trade_data)
 
-@st.cache_data
+    # Each category carries 5 consecutive yearly values, matching the
+    # per-category blocks in _TRADE_VALUES
+    categories = np.concatenate([
+        np.repeat(_ZAMBIA_TRADE_CATEGORIES, len(_YEARS)),
+        np.repeat(_BOTSWANA_TRADE_CATEGORIES, len(_YEARS))
+    ])
+
+    # Import/export flag as a categorical so downstream filters are a
+    # vectorized code compare instead of a per-row substring scan
+    direction = np.where(np.char.find(categories, 'Imports') >= 0, 'Import', 'Export')
+
+    df = pd.DataFrame({
+        'Year': np.tile(_YEARS, 12),
+        'Country': np.repeat(['Zambia', 'Botswana'], 30),
+        'Category': categories,
+        'Value_USD_Millions': _TRADE_VALUES
+    }, copy=False)
+    df['Direction'] = pd.Categorical(direction, categories=['Import', 'Export'])
+
+    for col in ('Country', 'Category'):
+        df[col] = df[col].astype('category')
+
+    return df
+
+@st.cache_resource
 def load_processing_capacity():
     """
     Current agro-processing capacity and utilization
     Source: Ministry of Agriculture, Industry Surveys
+
+    Cached as a shared resource: the returned frame is a single instance
+    reused across reruns and must be treated as read-only.
     """
-    
-    capacity_data = {
-        'Country': ['Zambia', 'Zambia', 'Zambia', 'Zambia', 'Zambia', 'Zambia',
-                   'Botswana', 'Botswana', 'Botswana', 'Botswana'],
-        'Processing_Type': [
-            'Maize Milling', 'Wheat Milling', 'Vegetable Oil Extraction', 
-            'Cotton Ginning', 'Dairy Processing', 'Meat Processing',
-            'Maize Milling', 'Dairy Processing', 'Meat Processing', 'Vegetable Processing'
-        ],
-        'Number_of_Facilities': [85, 12, 8, 15, 25, 35, 8, 5, 12, 4],
-        'Total_Capacity_MT_per_year': [
-            2500000, 400000, 150000, 200000, 180000, 250000,
-            80000, 50000, 120000, 15000
-        ],
-        'Capacity_Utilization_Percent': [75, 60, 45, 70, 65, 80, 55, 70, 85, 40],
-        'Investment_Potential': ['Medium', 'High', 'Very High', 'Medium', 'High', 'Medium',
-                                'High', 'Medium', 'Low', 'Very High']
-    }
-    
-    df = pd.DataFrame(capacity_data)
-    df['Unutilized_Capacity_MT'] = df['Total_Capacity_MT_per_year'] * (100 - df['Capacity_Utilization_Percent']) / 100
-    
+
+    df = pd.DataFrame({
+        'Country': np.repeat(['Zambia', 'Botswana'], [6, 4]),
+        'Processing_Type': _CAPACITY_TYPES,
+        'Number_of_Facilities': _CAPACITY_FACILITIES,
+        'Total_Capacity_MT_per_year': _CAPACITY_TOTAL,
+        'Capacity_Utilization_Percent': _CAPACITY_UTILIZATION,
+        'Investment_Potential': _CAPACITY_POTENTIAL,
+        'Unutilized_Capacity_MT': _CAPACITY_UNUTILIZED
+    }, copy=False)
+
+    for col in ('Country', 'Processing_Type'):
+        df[col] = df[col].astype('category')
+
     return df
 
-@st.cache_data
+_PRICE_COMMODITIES = ['Maize', 'Wheat', 'Soybean', 'Cotton', 'Groundnuts']
+
+def _synthesize_prices(n: int, seed: int = 42) -> np.ndarray:
+    """
+    Synthesize the (5, n) commodity price matrix: base + trend +
+    seasonality + noise, floored at 50% of base.
+
+    Pure numeric kernel - no pandas or Streamlit objects - so the whole
+    synthesis is one broadcast pass over a single output buffer.
+    """
+
+    # Per-commodity parameters as column vectors for broadcasting
+    base = np.array([180, 280, 450, 1800, 900], dtype=np.float64)[:, None]
+    trend = np.array([40, 50, 80, 200, 100], dtype=np.float64)[:, None]
+    amplitude = np.array([30, 35, 50, 150, 80], dtype=np.float64)[:, None]
+    noise_sd = np.array([15, 20, 30, 100, 50], dtype=np.float64)[:, None]
+
+    rng = np.random.default_rng(seed)
+
+    t = np.linspace(0, 1, n)
+    season = np.sin(np.linspace(0, 5 * 2 * np.pi, n))
+    prices = base + trend * t + amplitude * season + rng.normal(0, noise_sd, (5, n))
+    return np.maximum(prices, base * 0.5)  # Floor at 50% of base
+
+@st.cache_resource
 def load_price_data():
     """
     Commodity price trends
     Source: National Agricultural Marketing Boards, FAO
+
+    Cached as a shared resource: the returned frame is a single instance
+    reused across reruns and must be treated as read-only.
     """
-    
-    dates = pd.date_range(start='2019-01-01', end='2024-10-31', freq='ME')
-    
-    # Base prices with trends and seasonality
-    np.random.seed(42)
-    
-    def generate_price_series(base_price, trend, seasonality_amplitude, noise_level):
-        n = len(dates)
-        trend_component = np.linspace(0, trend, n)
-        seasonal_component = seasonality_amplitude * np.sin(np.linspace(0, 5*2*np.pi, n))
-        noise = np.random.normal(0, noise_level, n)
-        prices = base_price + trend_component + seasonal_component + noise
-        return np.maximum(prices, base_price * 0.5)  # Floor at 50% of base
-    
-    price_data = {
-        'Date': dates,
-        'Maize_USD_per_MT': generate_price_series(180, 40, 30, 15),
-        'Wheat_USD_per_MT': generate_price_series(280, 50, 35, 20),
-        'Soybean_USD_per_MT': generate_price_series(450, 80, 50, 30),
-        'Cotton_USD_per_MT': generate_price_series(1800, 200, 150, 100),
-        'Groundnuts_USD_per_MT': generate_price_series(900, 100, 80, 50)
-    }
-    
+
+    # Synthesize on a plain integer month index; the DatetimeIndex is only
+    # materialized for the final frame (nothing downstream does date math)
+    n = 70  # month-ends, Jan 2019 - Oct 2024
+    prices = _synthesize_prices(n)
+
+    price_data = {'Date': pd.date_range('2019-01-31', periods=n, freq='ME')}
+    for i, commodity in enumerate(_PRICE_COMMODITIES):
+        price_data[f'{commodity}_USD_per_MT'] = prices[i]
+
     return pd.DataFrame(price_data)
 
-@st.cache_data
+@st.cache_resource
 def load_investment_opportunities():
     """
     Specific investment opportunities identified from gaps
+
+    Cached as a shared resource: the returned frame is a single instance
+    reused across reruns and must be treated as read-only.
     """
     
     opportunities = {
@@ -331,11 +425,11 @@ def load_investment_opportunities():
             '5M - 15M', '3M - 8M', '8M - 20M', '10M - 25M', '1M - 3M',
             '2M - 5M', '4M - 10M', '3M - 7M', '1M - 3M'
         ],
-        'Estimated_ROI_Years': [4, 3.5, 5, 6, 3, 3.5, 5, 4, 3],
-        'Market_Gap_MT': [
+        'Estimated_ROI_Years': np.array([4, 3.5, 5, 6, 3, 3.5, 5, 4, 3]),
+        'Market_Gap_MT': np.array([
             85000, 200000, 120000, 60000, 15000,
             9000, 15000, 50000, 8000
-        ],
+        ], dtype=np.int64),
         'Key_Driver': [
             'High import dependency (85M USD/year)',
             'Growing export demand + local needs',
@@ -348,17 +442,564 @@ def load_investment_opportunities():
             'Premium pricing in SADC markets'
         ]
     }
-    
-    return pd.DataFrame(opportunities)
 
-# ============================================================
-# LOAD ALL DATA
-# ============================================================
-df_production = load_production_data()
-df_trade = load_trade_data()
-df_capacity = load_processing_capacity()
-df_prices = load_price_data()
-df_opportunities = load_investment_opportunities()
+    df = pd.DataFrame(opportunities)
+    # int8 codes instead of object strings: masks and equality in the
+    # country filters compare codes rather than Python strings
+    df['Country'] = pd.Categorical(df['Country'], categories=['Zambia', 'Botswana'])
+    # Arrow-backed storage for the free-text columns keeps string ops in
+    # native compute kernels (pyarrow ships with streamlit)
+    for col in ('Opportunity', 'Investment_Size_USD', 'Key_Driver'):
+        df[col] = df[col].astype('string[pyarrow]')
+    return df
+
+# ============================================================
+# LOAD ALL DATA
+# ============================================================
+df_production = load_production_data()
+df_trade = load_trade_data()
+df_capacity = load_processing_capacity()
+df_prices = load_price_data()
+df_opportunities = load_investment_opportunities()
+
+# ============================================================
+# FILTERED VIEWS & AGGREGATIONS (CACHED PER FILTER SELECTION)
+# ============================================================
+
+def fast_groupsum(keys: np.ndarray, values: np.ndarray):
+    """
+    Sum `values` per unique key using sort + np.add.reduceat.
+
+    For the small frames here, pandas' groupby setup (hashing, block
+    splitting) costs more than the arithmetic itself; this keeps the
+    single-key aggregations in plain NumPy. Returns (unique_keys, sums)
+    with keys in sorted order.
+    """
+    order = np.argsort(keys, kind='stable')
+    sorted_values = values[order]
+    unique_keys, first_idx = np.unique(keys[order], return_index=True)
+    return unique_keys, np.add.reduceat(sorted_values, first_idx)
+
+FilteredViews = namedtuple('FilteredViews', [
+    'production', 'trade', 'capacity', 'top_crops', 'yield_data',
+    'country_totals', 'imports_summary', 'exports_summary', 'gap_summary'
+])
+
+@st.cache_data
+def get_filtered_views(countries: tuple, y0: int, y1: int) -> FilteredViews:
+    """
+    Filter the base tables for the selected countries/years and precompute
+    the per-tab aggregations. Cached by (countries, year range) so widget
+    interactions that don't change the filters reuse the same results
+    instead of re-running the pandas pipeline on every rerun.
+    """
+
+    prod = df_production[
+        (df_production['Country'].isin(countries)) &
+        (df_production['Year'] >= y0) &
+        (df_production['Year'] <= y1)
+    ]
+
+    trade = df_trade[
+        (df_trade['Country'].isin(countries)) &
+        (df_trade['Year'] >= y0) &
+        (df_trade['Year'] <= y1)
+    ]
+
+    cap = df_capacity[df_capacity['Country'].isin(countries)]
+
+    # Top 5 crops by total production (tuple so it stays hashable)
+    crops, crop_totals = fast_groupsum(prod['Crop'].to_numpy(),
+                                       prod['Production_MT'].to_numpy())
+    top_crops = tuple(crops[np.argsort(crop_totals)[::-1][:5]])
+
+    # Average yields per country/crop
+    yield_data = prod.groupby(['Country', 'Crop'], observed=True).agg({
+        'Yield_MT_per_Ha': 'mean',
+        'Production_MT': 'mean'
+    }).reset_index()
+
+    # Production share per country
+    share_countries, share_totals = fast_groupsum(prod['Country'].to_numpy(),
+                                                  prod['Production_MT'].to_numpy())
+    country_totals = pd.DataFrame({'Country': share_countries,
+                                   'Production_MT': share_totals})
+
+    # Trade summaries
+    imports = trade[trade['Direction'] == 'Import']
+    imports_summary = (
+        imports.groupby(['Country', 'Category'], observed=True)['Value_USD_Millions']
+        .sum().reset_index().nlargest(10, 'Value_USD_Millions')
+    )
+
+    exports = trade[trade['Direction'] == 'Export']
+    exports_summary = (
+        exports.groupby(['Country', 'Category'], observed=True)['Value_USD_Millions']
+        .sum().reset_index()
+    )
+
+    # Processing gap summary
+    gap_summary = cap.groupby('Processing_Type', observed=True).agg({
+        'Total_Capacity_MT_per_year': 'sum',
+        'Capacity_Utilization_Percent': 'mean',
+        'Unutilized_Capacity_MT': 'sum',
+        'Investment_Potential': 'first'
+    }).reset_index().sort_values('Unutilized_Capacity_MT', ascending=False)
+
+    return FilteredViews(
+        prod, trade, cap, top_crops, yield_data,
+        country_totals, imports_summary, exports_summary, gap_summary
+    )
+
+# ============================================================
+# FIGURE BUILDERS (CACHED PER FILTER SELECTION)
+# ============================================================
+# Each builder is keyed on the same (countries, year range) tuple as the
+# filtered views and returns the figure as a plain dict - cheaper to cache
+# than a Figure instance - which the call site rehydrates via go.Figure().
+
+COUNTRY_COLORS = {'Zambia': '#c17a5c', 'Botswana': '#d4a574'}
+
+# Color code by investment potential
+POTENTIAL_COLORS = {
+    'Very High': '#2d5016',
+    'High': '#6b8e23',
+    'Medium': '#d4a574',
+    'Low': '#e8e6e0'
+}
+
+def _fmt_int(v) -> str:
+    """Thousands-grouped integer string via the int fast path of format."""
+    return f"{round(v):,d}"
+
+# Opportunity card template, parsed once at import. Rendered per row via
+# str.format and joined into a single st.markdown call per country. All
+# styling lives in the page stylesheet so each card carries only data.
+CARD_TMPL = """
+<div class="opportunity-card">
+<h3>🌟 {opp}</h3>
+<div class="tags">
+    <span class="investment-tag">💰 {inv}</span>
+    <span class="investment-tag">📈 ROI: {roi:.1f} years</span>
+    <span class="investment-tag">📊 Gap: {gap} MT</span>
+</div>
+<p><strong>Key Driver:</strong> {drv}</p>
+</div>
+"""
+
+@st.cache_resource
+def _card_formatter():
+    """Bound format method for the card template, shared across sessions."""
+    return CARD_TMPL.format
+
+# ============================================================
+# STATIC CONTENT (ALLOCATED ONCE AT IMPORT)
+# ============================================================
+
+ZAMBIA_CLIMATE_HTML = """
+    <div class="highlight-box">
+    <strong>Incentives & Support:</strong>
+    <ul>
+        <li><strong>Zambia Development Agency (ZDA):</strong> One-stop investment facilitation</li>
+        <li><strong>Tax Incentives:</strong> 0-5% corporate tax for 5 years in priority sectors</li>
+        <li><strong>Multi-Facility Economic Zones:</strong> Developed infrastructure for agro-processing</li>
+        <li><strong>Export Processing Zones:</strong> Duty-free inputs for export-oriented production</li>
+        <li><strong>Land Availability:</strong> Farm blocks with irrigation infrastructure</li>
+    </ul>
+
+    <strong>Key Institutions:</strong>
+    <ul>
+        <li>Ministry of Agriculture: www.agriculture.gov.zm</li>
+        <li>Zambia Development Agency: www.zda.org.zm</li>
+        <li>Citizens Economic Empowerment Commission (CEEC): SME support</li>
+    </ul>
+    </div>
+    """
+
+BOTSWANA_CLIMATE_HTML = """
+    <div class="highlight-box">
+    <strong>Incentives & Support:</strong>
+    <ul>
+        <li><strong>Botswana Investment & Trade Centre (BITC):</strong> Investment promotion</li>
+        <li><strong>Citizen Economic Empowerment:</strong> Support for local participation</li>
+        <li><strong>Special Economic Zones:</strong> Tax holidays and duty exemptions</li>
+        <li><strong>Financial Assistance Policy:</strong> Grant funding for agriculture projects</li>
+        <li><strong>Stable Economy:</strong> Strong governance and currency stability</li>
+    </ul>
+
+    <strong>Key Institutions:</strong>
+    <ul>
+        <li>Ministry of Agriculture: www.moa.gov.bw</li>
+        <li>BITC: www.bitc.co.bw</li>
+        <li>Local Enterprise Authority (LEA): SME support</li>
+    </ul>
+    </div>
+    """
+
+SADC_MARKET_HTML = """
+<div class="highlight-box">
+<strong>SADC Free Trade Area Benefits:</strong>
+
+Both Zambia and Botswana are members of SADC and COMESA, providing:
+
+<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-top: 15px;">
+<div>
+<strong>🎯 Market Access:</strong>
+<ul>
+    <li>300+ million consumers across SADC</li>
+    <li>Duty-free access to regional markets</li>
+    <li>Simplified customs procedures</li>
+    <li>Harmonized standards (ongoing)</li>
+</ul>
+</div>
+<div>
+<strong>🚚 Logistics Advantages:</strong>
+<ul>
+    <li>Central location in SADC</li>
+    <li>Access to multiple trade corridors</li>
+    <li>Improved road/rail infrastructure</li>
+    <li>Regional distribution hubs</li>
+</ul>
+</div>
+</div>
+</div>
+"""
+
+FOOTER_LEFT_MD = """
+    #### 🎯 Ready to Invest in SADC Agriculture?
+
+    This dashboard provides market intelligence, but successful investment requires:
+    - Detailed feasibility studies
+    - On-ground market validation
+    - Financial modeling
+    - Partner identification
+    - Regulatory compliance guidance
+
+    **We can help with all of the above.**
+    """
+
+FOOTER_RIGHT_MD = """
+    #### 📞 Contact Concise Analytics
+
+    **Services:**
+    - Custom feasibility studies
+    - Market entry strategy
+    - Partner identification
+    - Due diligence support
+    - Ongoing market intelligence
+
+    📧 **info@concise-analytics.com**  
+    🌐 **www.concise-analytics.com**  
+    📍 Gaborone, Botswana
+
+    *Specialized data intelligence for SADC agriculture, tourism, and property markets*
+    """
+
+DISCLAIMER_MD = """
+    **Investment Disclaimer:**
+
+    This dashboard provides market intelligence based on publicly available data sources.
+    All information is provided for informational purposes only and should not be construed
+    as investment advice.
+
+    - Production and trade data are estimates based on official statistics
+    - Processing capacity data from industry surveys and may not be comprehensive
+    - Price trends are indicative and subject to market volatility
+    - ROI calculations are simplified models and do not account for all variables
+    - Investment opportunities identified are based on market gaps and should be validated
+
+    **Before making any investment decision:**
+    - Conduct thorough due diligence
+    - Engage local experts and legal counsel
+    - Validate all assumptions with current market data
+    - Consider political, economic, and operational risks
+    - Develop comprehensive business plans
+
+    Concise Data Analytics provides market intelligence services but does not guarantee
+    investment returns or market outcomes.
+    """
+
+@st.cache_data
+def build_production_line_fig(countries: tuple, y0: int, y1: int) -> dict:
+    """Top-5 crops production trend lines (one WebGL trace per crop/country)."""
+    views = get_filtered_views(countries, y0, y1)
+    df_top_crops = views.production[views.production['Crop'].isin(views.top_crops)]
+
+    # Pivot once and emit the traces directly, skipping the px wrapper
+    pivot = df_top_crops.pivot_table(index='Year', columns=['Crop', 'Country'],
+                                     values='Production_MT', observed=True)
+    palette = px.colors.qualitative.Bold
+    crop_colors = {crop: palette[i % len(palette)]
+                   for i, crop in enumerate(views.top_crops)}
+
+    fig = go.Figure()
+    seen_crops = set()
+    for crop, country in pivot.columns:
+        fig.add_trace(go.Scattergl(
+            x=pivot.index,
+            y=pivot[(crop, country)].values,
+            name=crop,
+            legendgroup=crop,
+            showlegend=crop not in seen_crops,
+            mode='lines',
+            line=dict(color=crop_colors[crop])
+        ))
+        seen_crops.add(crop)
+
+    fig.update_layout(
+        title="Top 5 Crops by Production Volume",
+        xaxis_title="Year",
+        yaxis_title="Production (Metric Tons)",
+        hovermode='x unified',
+        height=450,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+
+    return fig.to_dict()
+
+@st.cache_data
+def build_yield_fig(countries: tuple, y0: int, y1: int) -> dict:
+    """Top-10 average yields horizontal bar chart."""
+    views = get_filtered_views(countries, y0, y1)
+    yield_data_sorted = views.yield_data.nlargest(10, 'Yield_MT_per_Ha')
+
+    fig = go.Figure([
+        go.Bar(
+            x=country_data['Yield_MT_per_Ha'],
+            y=country_data['Crop'],
+            orientation='h',
+            name=country,
+            marker_color=COUNTRY_COLORS[country]
+        )
+        for country, country_data in yield_data_sorted.groupby('Country', sort=False, observed=True)
+    ])
+
+    fig.update_layout(
+        title="Average Crop Yields (MT per Hectare)",
+        xaxis_title="Yield (MT/Ha)",
+        yaxis_title="Crop Type",
+        barmode='relative',
+        height=500
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def build_country_share_fig(countries: tuple, y0: int, y1: int) -> dict:
+    """Total production share pie chart."""
+    views = get_filtered_views(countries, y0, y1)
+    country_totals = views.country_totals
+
+    fig = go.Figure(go.Pie(
+        labels=country_totals['Country'],
+        values=country_totals['Production_MT'],
+        marker=dict(colors=[COUNTRY_COLORS.get(c, '#d4a574')
+                            for c in country_totals['Country']]),
+        textposition='inside',
+        textinfo='percent+label'
+    ))
+    fig.update_layout(title="Total Production Share")
+    return fig.to_dict()
+
+@st.cache_data
+def build_crop_country_fig(countries: tuple, y0: int, y1: int) -> dict:
+    """Top-10 crop-country combinations bar chart."""
+    views = get_filtered_views(countries, y0, y1)
+    crop_country = views.production.groupby(['Country', 'Crop'], observed=True)['Production_MT'].sum().reset_index()
+    crop_country = crop_country.nlargest(10, 'Production_MT')
+
+    fig = go.Figure([
+        go.Bar(
+            x=country_data['Production_MT'],
+            y=country_data['Crop'],
+            orientation='h',
+            name=country,
+            marker_color=COUNTRY_COLORS[country]
+        )
+        for country, country_data in crop_country.groupby('Country', sort=False, observed=True)
+    ])
+    fig.update_layout(
+        title="Top 10 Crop-Country Combinations",
+        xaxis_title="Production_MT",
+        yaxis_title="Crop",
+        barmode='relative'
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def build_imports_fig(countries: tuple, y0: int, y1: int) -> dict:
+    """Major import categories bar chart."""
+    views = get_filtered_views(countries, y0, y1)
+
+    fig = go.Figure([
+        go.Bar(
+            x=country_data['Value_USD_Millions'],
+            y=country_data['Category'],
+            orientation='h',
+            name=country,
+            marker_color=COUNTRY_COLORS[country]
+        )
+        for country, country_data in views.imports_summary.groupby('Country', sort=False, observed=True)
+    ])
+    fig.update_layout(
+        title="Major Import Categories (USD Millions)",
+        xaxis_title="Import Value (USD Millions)",
+        yaxis_title="Category",
+        barmode='relative',
+        height=400,
+        showlegend=True
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def build_exports_fig(countries: tuple, y0: int, y1: int) -> dict:
+    """Export performance bar chart."""
+    views = get_filtered_views(countries, y0, y1)
+
+    fig = go.Figure([
+        go.Bar(
+            x=country_data['Value_USD_Millions'],
+            y=country_data['Category'],
+            orientation='h',
+            name=country,
+            marker_color=COUNTRY_COLORS[country]
+        )
+        for country, country_data in views.exports_summary.groupby('Country', sort=False, observed=True)
+    ])
+    fig.update_layout(
+        title="Export Performance (USD Millions)",
+        xaxis_title="Export Value (USD Millions)",
+        yaxis_title="Category",
+        barmode='relative',
+        height=400,
+        showlegend=True
+    )
+    return fig.to_dict()
+
+@st.cache_data
+def build_capacity_fig(countries: tuple, y0: int, y1: int) -> dict:
+    """Processing capacity utilization stacked bar chart."""
+    views = get_filtered_views(countries, y0, y1)
+
+    # Melt once into long form and emit exactly two traces (one per stack
+    # segment) instead of two traces per country
+    cap = views.capacity.assign(
+        Utilized=views.capacity['Total_Capacity_MT_per_year']
+        * views.capacity['Capacity_Utilization_Percent'] / 100
+    )
+    long = cap.melt(
+        id_vars=['Country', 'Processing_Type'],
+        value_vars=['Utilized', 'Unutilized_Capacity_MT'],
+        var_name='Segment'
+    )
+
+    utilized = long[long['Segment'] == 'Utilized']
+    unutilized = long[long['Segment'] == 'Unutilized_Capacity_MT']
+
+    fig = go.Figure([
+        go.Bar(
+            name='Utilized',
+            x=utilized['Processing_Type'],
+            y=utilized['value'],
+            marker_color=np.where(utilized['Country'] == 'Zambia',
+                                  COUNTRY_COLORS['Zambia'],
+                                  COUNTRY_COLORS['Botswana'])
+        ),
+        go.Bar(
+            name='Unutilized',
+            x=unutilized['Processing_Type'],
+            y=unutilized['value'],
+            marker_color='#e8e6e0',
+            marker_pattern_shape="/"
+        )
+    ])
+
+    fig.update_layout(
+        title="Processing Capacity Utilization by Type",
+        xaxis_title="Processing Type",
+        yaxis_title="Capacity (MT per year)",
+        barmode='stack',
+        height=450,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+
+    return fig.to_dict()
+
+@st.cache_data
+def build_gap_fig(countries: tuple, y0: int, y1: int) -> dict:
+    """Unutilized capacity bar chart, color-coded by investment potential."""
+    views = get_filtered_views(countries, y0, y1)
+    gap_summary = views.gap_summary.copy()
+    gap_summary['Color'] = (
+        gap_summary['Investment_Potential'].map(POTENTIAL_COLORS).fillna('#e8e6e0')
+    )
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=gap_summary['Processing_Type'],
+        y=gap_summary['Unutilized_Capacity_MT'],
+        marker_color=gap_summary['Color'],
+        text=gap_summary['Investment_Potential'],
+        textposition='outside',
+        hovertemplate='<b>%{x}</b><br>' +
+                      'Unutilized: %{y:,.0f} MT<br>' +
+                      'Potential: %{text}<br>' +
+                      '<extra></extra>'
+    ))
+
+    fig.update_layout(
+        title="Unutilized Processing Capacity by Type (Investment Potential Color-Coded)",
+        xaxis_title="Processing Type",
+        yaxis_title="Unutilized Capacity (MT/year)",
+        height=400
+    )
+
+    return fig.to_dict()
+
+# Cap on rendered points per price trace. Monthly data stays far below
+# this; if the series ever moves to daily/tick granularity the chart
+# payload stays bounded instead of growing linearly.
+_PRICE_MAX_POINTS = 2000
+
+@st.cache_data
+def build_price_fig(commodities: tuple) -> dict:
+    """Commodity price trend lines for the selected commodities."""
+    step = max(1, -(-len(df_prices) // _PRICE_MAX_POINTS))
+    dates = df_prices['Date'].iloc[::step]
+
+    fig = go.Figure()
+
+    for commodity in commodities:
+        col_name = f'{commodity}_USD_per_MT'
+        if col_name in df_prices.columns:
+            fig.add_trace(go.Scattergl(
+                x=dates,
+                y=df_prices[col_name].iloc[::step],
+                name=commodity,
+                mode='lines',
+                line=dict(width=2)
+            ))
+
+    fig.update_layout(
+        title="Commodity Price Trends (USD per Metric Ton)",
+        xaxis_title="Date",
+        yaxis_title="Price (USD/MT)",
+        hovermode='x unified',
+        height=400,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+
+    return fig.to_dict()
+
+@st.cache_data(ttl="1h", max_entries=8)
+def filter_opps(countries: tuple) -> pd.DataFrame:
+    """
+    Opportunities for the selected countries. Keyed on a sorted tuple so
+    the ROI-calculator reruns hit the cache instead of rebuilding the
+    boolean mask; max_entries bounds the cache at the handful of possible
+    selections.
+    """
+    return df_opportunities[df_opportunities['Country'].isin(countries)]
 
 # ============================================================
 # SIDEBAR - FILTERS & INFO
@@ -379,6 +1020,12 @@ selected_countries = st.sidebar.multiselect(
     default=['Zambia', 'Botswana']
 )
 
+# Nothing selected: stop before any aggregation or chart construction
+# runs against empty frames
+if not selected_countries:
+    st.warning("Please select at least one country to view the dashboard.")
+    st.stop()
+
 # Year range filter
 year_range = st.sidebar.slider(
     "Year Range",
@@ -420,20 +1067,12 @@ st.sidebar.markdown("""
 **info@concise-analytics.com**
 """)
 
-# Filter data based on selections
-df_production_filtered = df_production[
-    (df_production['Country'].isin(selected_countries)) &
-    (df_production['Year'] >= year_range[0]) &
-    (df_production['Year'] <= year_range[1])
-]
-
-df_trade_filtered = df_trade[
-    (df_trade['Country'].isin(selected_countries)) &
-    (df_trade['Year'] >= year_range[0]) &
-    (df_trade['Year'] <= year_range[1])
-]
-
-df_capacity_filtered = df_capacity[df_capacity['Country'].isin(selected_countries)]
+# Filter data based on selections (tuple: lists aren't hashable cache keys)
+countries_key = tuple(selected_countries)
+views = get_filtered_views(countries_key, year_range[0], year_range[1])
+df_production_filtered = views.production
+df_trade_filtered = views.trade
+df_capacity_filtered = views.capacity
 
 # ============================================================
 # MAIN DASHBOARD
@@ -457,13 +1096,15 @@ st.subheader("📈 Market Overview")
 
 col1, col2, col3, col4, col5 = st.columns(5)
 
-# Calculate key metrics
-total_production = df_production_filtered['Production_MT'].sum() / 1e6
-latest_year_prod = df_production_filtered[df_production_filtered['Year'] == year_range[1]]['Production_MT'].sum() / 1e6
-prev_year_prod = df_production_filtered[df_production_filtered['Year'] == year_range[1]-1]['Production_MT'].sum() / 1e6
+# Calculate key metrics: one pass over the production frame instead of a
+# boolean mask per year
+prod_by_year = df_production_filtered.groupby('Year')['Production_MT'].sum()
+total_production = prod_by_year.sum() / 1e6
+latest_year_prod = prod_by_year.get(year_range[1], 0) / 1e6
+prev_year_prod = prod_by_year.get(year_range[1]-1, 0) / 1e6
 yoy_growth = ((latest_year_prod - prev_year_prod) / prev_year_prod * 100) if prev_year_prod > 0 else 0
 
-total_imports = df_trade_filtered[df_trade_filtered['Category'].str.contains('Imports')]['Value_USD_Millions'].sum()
+total_imports = df_trade_filtered[df_trade_filtered['Direction'] == 'Import']['Value_USD_Millions'].sum()
 processing_gap = df_capacity_filtered['Unutilized_Capacity_MT'].sum() / 1000
 
 with col1:
@@ -487,8 +1128,11 @@ with col3:
         "Unutilized capacity"
     )
 
+# One cached lookup over the opportunities frame, shared by the two KPI columns
+opps_selected = filter_opps(tuple(sorted(selected_countries)))
+
 with col4:
-    investment_opps = len(df_opportunities[df_opportunities['Country'].isin(selected_countries)])
+    investment_opps = len(opps_selected)
     st.metric(
         "Investment Opportunities",
         f"{investment_opps}",
@@ -496,7 +1140,7 @@ with col4:
     )
 
 with col5:
-    avg_roi = df_opportunities[df_opportunities['Country'].isin(selected_countries)]['Estimated_ROI_Years'].mean()
+    avg_roi = opps_selected['Estimated_ROI_Years'].mean()
     st.metric(
         "Avg ROI Timeline",
         f"{avg_roi:.1f} years",
@@ -519,39 +1163,26 @@ with tab1:
         # Production trends by crop
         st.markdown("##### Major Crops Production Trends")
         
-        # Get top 5 crops by production
-        top_crops = df_production_filtered.groupby('Crop')['Production_MT'].sum().nlargest(5).index
-        df_top_crops = df_production_filtered[df_production_filtered['Crop'].isin(top_crops)]
-        
-        fig_production = px.line(
-            df_top_crops,
-            x='Year',
-            y='Production_MT',
-            color='Crop',
-            line_group='Country',
-            title="Top 5 Crops by Production Volume",
-            labels={'Production_MT': 'Production (Metric Tons)', 'Year': 'Year'},
-            color_discrete_sequence=px.colors.qualitative.Bold
-        )
-        
-        fig_production.update_layout(
-            hovermode='x unified',
-            height=450,
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        
+        # Get top 5 crops by production (precomputed in the cached view)
+        top_crops = views.top_crops
+
+        fig_production = go.Figure(build_production_line_fig(countries_key, year_range[0], year_range[1]))
         st.plotly_chart(fig_production, width='stretch')
     
     with col2:
         st.markdown("##### Production Insights")
         
-        # Calculate growth rates
+        # Calculate growth rates: one aggregation pass per year instead of
+        # a boolean scan per crop
         latest_year_data = df_production_filtered[df_production_filtered['Year'] == year_range[1]]
         prev_year_data = df_production_filtered[df_production_filtered['Year'] == year_range[1]-1]
-        
+
+        latest_by_crop = latest_year_data.groupby('Crop', observed=True)['Production_MT'].sum()
+        prev_by_crop = prev_year_data.groupby('Crop', observed=True)['Production_MT'].sum()
+
         for crop in top_crops:
-            latest = latest_year_data[latest_year_data['Crop'] == crop]['Production_MT'].sum()
-            previous = prev_year_data[prev_year_data['Crop'] == crop]['Production_MT'].sum()
+            latest = latest_by_crop.get(crop, 0)
+            previous = prev_by_crop.get(crop, 0)
             if previous > 0:
                 growth = ((latest - previous) / previous * 100)
                 st.metric(crop, f"{latest/1000:.0f}K MT", f"{growth:+.1f}%")
@@ -559,27 +1190,7 @@ with tab1:
 with tab2:
     st.markdown("##### Yield Efficiency Analysis")
     
-    # Calculate average yields
-    yield_data = df_production_filtered.groupby(['Country', 'Crop']).agg({
-        'Yield_MT_per_Ha': 'mean',
-        'Production_MT': 'mean'
-    }).reset_index()
-    
-    # Top 10 by average yield
-    yield_data_sorted = yield_data.nlargest(10, 'Yield_MT_per_Ha')
-    
-    fig_yield = px.bar(
-        yield_data_sorted,
-        x='Yield_MT_per_Ha',
-        y='Crop',
-        color='Country',
-        orientation='h',
-        title="Average Crop Yields (MT per Hectare)",
-        labels={'Yield_MT_per_Ha': 'Yield (MT/Ha)', 'Crop': 'Crop Type'},
-        color_discrete_map={'Zambia': '#c17a5c', 'Botswana': '#d4a574'}
-    )
-    
-    fig_yield.update_layout(height=500)
+    fig_yield = go.Figure(build_yield_fig(countries_key, year_range[0], year_range[1]))
     st.plotly_chart(fig_yield, width='stretch')
     
     st.markdown("""
@@ -596,36 +1207,14 @@ with tab2:
 with tab3:
     st.markdown("##### Country Production Comparison")
     
-    # Production by country
-    country_totals = df_production_filtered.groupby('Country')['Production_MT'].sum().reset_index()
-    
     col1, col2 = st.columns(2)
-    
+
     with col1:
-        fig_country = px.pie(
-            country_totals,
-            values='Production_MT',
-            names='Country',
-            title="Total Production Share",
-            color_discrete_map={'Zambia': '#c17a5c', 'Botswana': '#d4a574'}
-        )
-        fig_country.update_traces(textposition='inside', textinfo='percent+label')
+        fig_country = go.Figure(build_country_share_fig(countries_key, year_range[0], year_range[1]))
         st.plotly_chart(fig_country, width='stretch')
-    
+
     with col2:
-        # Production by crop and country
-        crop_country = df_production_filtered.groupby(['Country', 'Crop'])['Production_MT'].sum().reset_index()
-        crop_country = crop_country.nlargest(10, 'Production_MT')
-        
-        fig_crop_country = px.bar(
-            crop_country,
-            x='Production_MT',
-            y='Crop',
-            color='Country',
-            orientation='h',
-            title="Top 10 Crop-Country Combinations",
-            color_discrete_map={'Zambia': '#c17a5c', 'Botswana': '#d4a574'}
-        )
+        fig_crop_country = go.Figure(build_crop_country_fig(countries_key, year_range[0], year_range[1]))
         st.plotly_chart(fig_crop_country, width='stretch')
 
 st.markdown("---")
@@ -640,41 +1229,14 @@ col1, col2 = st.columns(2)
 with col1:
     st.markdown("##### Import Dependencies")
     
-    imports = df_trade_filtered[df_trade_filtered['Category'].str.contains('Imports')]
-    imports_summary = imports.groupby(['Country', 'Category'])['Value_USD_Millions'].sum().reset_index()
-    imports_summary = imports_summary.nlargest(10, 'Value_USD_Millions')
-    
-    fig_imports = px.bar(
-        imports_summary,
-        x='Value_USD_Millions',
-        y='Category',
-        color='Country',
-        orientation='h',
-        title="Major Import Categories (USD Millions)",
-        labels={'Value_USD_Millions': 'Import Value (USD Millions)'},
-        color_discrete_map={'Zambia': '#c17a5c', 'Botswana': '#d4a574'}
-    )
-    fig_imports.update_layout(height=400, showlegend=True)
+    fig_imports = go.Figure(build_imports_fig(countries_key, year_range[0], year_range[1]))
     st.plotly_chart(fig_imports, width='stretch')
 
 with col2:
     st.markdown("##### Export Potential")
     
-    exports = df_trade_filtered[df_trade_filtered['Category'].str.contains('Exports')]
-    if len(exports) > 0:
-        exports_summary = exports.groupby(['Country', 'Category'])['Value_USD_Millions'].sum().reset_index()
-        
-        fig_exports = px.bar(
-            exports_summary,
-            x='Value_USD_Millions',
-            y='Category',
-            color='Country',
-            orientation='h',
-            title="Export Performance (USD Millions)",
-            labels={'Value_USD_Millions': 'Export Value (USD Millions)'},
-            color_discrete_map={'Zambia': '#c17a5c', 'Botswana': '#d4a574'}
-        )
-        fig_exports.update_layout(height=400, showlegend=True)
+    if len(views.exports_summary) > 0:
+        fig_exports = go.Figure(build_exports_fig(countries_key, year_range[0], year_range[1]))
         st.plotly_chart(fig_exports, width='stretch')
     else:
         st.info("Limited export data for Botswana (net importer)")
@@ -721,35 +1283,7 @@ col1, col2 = st.columns([2, 1])
 
 with col1:
     # Capacity utilization chart
-    fig_capacity = go.Figure()
-    
-    for country in df_capacity_filtered['Country'].unique():
-        country_data = df_capacity_filtered[df_capacity_filtered['Country'] == country]
-        
-        fig_capacity.add_trace(go.Bar(
-            name=f'{country} - Utilized',
-            x=country_data['Processing_Type'],
-            y=country_data['Total_Capacity_MT_per_year'] * country_data['Capacity_Utilization_Percent'] / 100,
-            marker_color='#c17a5c' if country == 'Zambia' else '#d4a574'
-        ))
-        
-        fig_capacity.add_trace(go.Bar(
-            name=f'{country} - Unutilized',
-            x=country_data['Processing_Type'],
-            y=country_data['Unutilized_Capacity_MT'],
-            marker_color='#e8e6e0',
-            marker_pattern_shape="/"
-        ))
-    
-    fig_capacity.update_layout(
-        title="Processing Capacity Utilization by Type",
-        xaxis_title="Processing Type",
-        yaxis_title="Capacity (MT per year)",
-        barmode='stack',
-        height=450,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
-    
+    fig_capacity = go.Figure(build_capacity_fig(countries_key, year_range[0], year_range[1]))
     st.plotly_chart(fig_capacity, width='stretch')
 
 with col2:
@@ -768,48 +1302,7 @@ with col2:
 # Processing gap details
 st.markdown("##### 🎯 Processing Gap Analysis")
 
-gap_summary = df_capacity_filtered.groupby('Processing_Type').agg({
-    'Total_Capacity_MT_per_year': 'sum',
-    'Capacity_Utilization_Percent': 'mean',
-    'Unutilized_Capacity_MT': 'sum',
-    'Investment_Potential': 'first'
-}).reset_index()
-
-gap_summary = gap_summary.sort_values('Unutilized_Capacity_MT', ascending=False)
-
-# Color code by investment potential
-def get_potential_color(potential):
-    colors = {
-        'Very High': '#2d5016',
-        'High': '#6b8e23',
-        'Medium': '#d4a574',
-        'Low': '#e8e6e0'
-    }
-    return colors.get(potential, '#e8e6e0')
-
-gap_summary['Color'] = gap_summary['Investment_Potential'].apply(get_potential_color)
-
-fig_gap = go.Figure()
-
-fig_gap.add_trace(go.Bar(
-    x=gap_summary['Processing_Type'],
-    y=gap_summary['Unutilized_Capacity_MT'],
-    marker_color=gap_summary['Color'],
-    text=gap_summary['Investment_Potential'],
-    textposition='outside',
-    hovertemplate='<b>%{x}</b><br>' +
-                  'Unutilized: %{y:,.0f} MT<br>' +
-                  'Potential: %{text}<br>' +
-                  '<extra></extra>'
-))
-
-fig_gap.update_layout(
-    title="Unutilized Processing Capacity by Type (Investment Potential Color-Coded)",
-    xaxis_title="Processing Type",
-    yaxis_title="Unutilized Capacity (MT/year)",
-    height=400
-)
-
+fig_gap = go.Figure(build_gap_fig(countries_key, year_range[0], year_range[1]))
 st.plotly_chart(fig_gap, width='stretch')
 
 st.markdown("---")
@@ -826,47 +1319,32 @@ selected_commodities = st.multiselect(
     default=['Maize', 'Soybean', 'Wheat']
 )
 
+# Nothing selected: skip the chart and price-insight computation entirely
+if not selected_commodities:
+    st.info("Select at least one commodity to view price trends.")
+
 if selected_commodities:
-    fig_prices = go.Figure()
-    
-    for commodity in selected_commodities:
-        col_name = f'{commodity}_USD_per_MT'
-        if col_name in df_prices.columns:
-            fig_prices.add_trace(go.Scatter(
-                x=df_prices['Date'],
-                y=df_prices[col_name],
-                name=commodity,
-                mode='lines',
-                line=dict(width=2)
-            ))
-    
-    fig_prices.update_layout(
-        title="Commodity Price Trends (USD per Metric Ton)",
-        xaxis_title="Date",
-        yaxis_title="Price (USD/MT)",
-        hovermode='x unified',
-        height=400,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-    )
-    
+    fig_prices = go.Figure(build_price_fig(tuple(selected_commodities)))
     st.plotly_chart(fig_prices, width='stretch')
     
-    # Price insights
+    # Price insights: one row slice per point in time instead of
+    # per-commodity scalar lookups
     col1, col2, col3 = st.columns(3)
-    
-    for i, commodity in enumerate(selected_commodities[:3]):
-        col_name = f'{commodity}_USD_per_MT'
-        if col_name in df_prices.columns:
-            current_price = df_prices[col_name].iloc[-1]
-            year_ago_price = df_prices[col_name].iloc[-13] if len(df_prices) > 13 else df_prices[col_name].iloc[0]
-            price_change = ((current_price - year_ago_price) / year_ago_price * 100)
-            
-            with [col1, col2, col3][i]:
-                st.metric(
-                    f"{commodity} Price",
-                    f"${current_price:.0f}/MT",
-                    f"{price_change:+.1f}% YoY"
-                )
+
+    price_cols = [f'{c}_USD_per_MT' for c in selected_commodities[:3]
+                  if f'{c}_USD_per_MT' in df_prices.columns]
+    current_prices = df_prices[price_cols].iloc[-1]
+    year_ago_prices = df_prices[price_cols].iloc[-13 if len(df_prices) > 13 else 0]
+    price_changes = (current_prices - year_ago_prices) / year_ago_prices * 100
+
+    for i, col_name in enumerate(price_cols):
+        commodity = col_name.removesuffix('_USD_per_MT')
+        with [col1, col2, col3][i]:
+            st.metric(
+                f"{commodity} Price",
+                f"${current_prices[col_name]:.0f}/MT",
+                f"{price_changes[col_name]:+.1f}% YoY"
+            )
 
 st.markdown("---")
 
@@ -880,39 +1358,58 @@ Based on production capacity, trade gaps, and market demand, we've identified th
 high-potential investment opportunities for private sector organizations.
 """)
 
-# Filter opportunities by country
-df_opp_filtered = df_opportunities[df_opportunities['Country'].isin(selected_countries)]
-
-# Create tabs for each country
-if len(selected_countries) == 2:
-    tab1, tab2 = st.tabs([f"🇿🇲 Zambia Opportunities", f"🇧🇼 Botswana Opportunities"])
-    tabs = [tab1, tab2]
-    countries = ['Zambia', 'Botswana']
-elif 'Zambia' in selected_countries:
-    tab1 = st.container()
-    tabs = [tab1]
-    countries = ['Zambia']
-else:
-    tab1 = st.container()
-    tabs = [tab1]
-    countries = ['Botswana']
-
-for tab, country in zip(tabs, countries):
-    with tab:
-        country_opps = df_opp_filtered[df_opp_filtered['Country'] == country]
-        
-        for idx, row in country_opps.iterrows():
-            st.markdown(f"""
-            <div class="opportunity-card">
-            <h3>🌟 {row['Opportunity']}</h3>
-            <div style="margin: 10px 0;">
-                <span class="investment-tag">💰 {row['Investment_Size_USD']}</span>
-                <span class="investment-tag">📈 ROI: {row['Estimated_ROI_Years']:.1f} years</span>
-                <span class="investment-tag">📊 Gap: {row['Market_Gap_MT']:,.0f} MT</span>
-            </div>
-            <p><strong>Key Driver:</strong> {row['Key_Driver']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+# Canonical selection tuple -> (layout kind, countries in render order)
+_TAB_CFG = {
+    ('Botswana', 'Zambia'): ('tabs', ['Zambia', 'Botswana']),
+    ('Zambia',): ('container', ['Zambia']),
+    ('Botswana',): ('container', ['Botswana']),
+}
+
+@st.fragment
+def render_opportunities(selected_countries: list) -> None:
+    """
+    Opportunity tabs, isolated as a fragment so widget changes elsewhere
+    on the page do not re-render this section.
+    """
+    # Filter opportunities by country
+    df_opp_filtered = filter_opps(tuple(sorted(selected_countries)))
+
+    # One tab per country when both are selected, otherwise a plain
+    # container for the single country; one dict lookup, no elif ladder
+    kind, countries = _TAB_CFG[tuple(sorted(selected_countries))]
+    if kind == 'tabs':
+        tabs = st.tabs(["🇿🇲 Zambia Opportunities", "🇧🇼 Botswana Opportunities"])
+    else:
+        tabs = [st.container()]
+
+    # Split per country once; each tab then takes its slice with a dict
+    # lookup instead of re-scanning the filtered frame
+    opp_groups = dict(tuple(df_opp_filtered.groupby('Country', sort=False, observed=True)))
+
+    format_card = _card_formatter()
+    for tab, country in zip(tabs, countries):
+        with tab:
+            country_opps = opp_groups.get(country, df_opp_filtered.iloc[:0])
+
+            # itertuples avoids per-row Series construction; joining the
+            # cards inside one grid container sends a single markdown
+            # element per country instead of one per row
+            cards = "".join(
+                format_card(
+                    opp=row.Opportunity,
+                    inv=row.Investment_Size_USD,
+                    roi=row.Estimated_ROI_Years,
+                    gap=_fmt_int(row.Market_Gap_MT),
+                    drv=row.Key_Driver
+                )
+                for row in country_opps.itertuples(index=False)
+            )
+            st.markdown(
+                "<div class='opportunity-grid'>" + cards + "</div>",
+                unsafe_allow_html=True
+            )
+
+render_opportunities(selected_countries)
 
 st.markdown("---")
 
@@ -923,74 +1420,99 @@ st.subheader("🧮 Investment ROI Calculator")
 
 st.markdown("Quick financial modeling for agro-processing investments")
 
-calc_col1, calc_col2, calc_col3, calc_col4 = st.columns(4)
-
-with calc_col1:
-    investment_amount = st.number_input(
-        "Initial Investment (USD)",
-        min_value=100000,
-        max_value=50000000,
-        value=5000000,
-        step=500000,
-        format="%d"
-    )
-
-with calc_col2:
-    processing_capacity = st.number_input(
-        "Processing Capacity (MT/year)",
-        min_value=1000,
-        max_value=500000,
-        value=50000,
-        step=5000
-    )
+# Net share of revenue after the assumed 65% operating costs
+NET_MARGIN = 0.35
 
-with calc_col3:
-    capacity_utilization = st.slider(
-        "Expected Capacity Utilization (%)",
-        min_value=30,
-        max_value=95,
-        value=70,
-        step=5
-    )
+@st.cache_data(max_entries=256)
+def compute_roi(investment: int, capacity: int, utilization: int, margin: int) -> dict:
+    """
+    ROI model for the calculator, returning display-ready strings.
+    Cached per input combination so repeat slider positions skip both
+    the recompute and the formatting on rerun.
+    """
+    actual_processing = capacity * utilization / 100
+    annual_revenue = actual_processing * margin
+    net_profit = annual_revenue * NET_MARGIN
+    # Floor instead of branch: a zero-profit input yields an absurdly
+    # large payback that the formatting stage maps to "Review inputs"
+    payback_period = investment / max(net_profit, 1e-9)
+    annual_roi = net_profit / max(investment, 1e-9) * 100
+    return {
+        'actual_str': f"{_fmt_int(actual_processing)} MT",
+        'rev_str': f"${_fmt_int(annual_revenue)}",
+        'profit_str': f"${_fmt_int(net_profit)}",
+        'payback_str': (f"{payback_period:.1f} years"
+                        if 0 < payback_period < 20 else "Review inputs"),
+        'roi_str': f"{annual_roi:.1f}%" if 0 < payback_period < 20 else None
+    }
 
-with calc_col4:
-    margin_per_mt = st.number_input(
-        "Gross Margin per MT (USD)",
-        min_value=10,
-        max_value=1000,
-        value=150,
-        step=10
-    )
+@st.fragment
+def render_roi_calculator() -> None:
+    """
+    ROI inputs and result metrics, isolated as a fragment so slider
+    and number-input changes rerun only this section.
+    """
+    # One 4-column grid for the whole calculator: inputs on top, the
+    # matching result metric below, so the layout delta is sent once
+    cols = st.columns(4)
+
+    with cols[0]:
+        investment_amount = st.number_input(
+            "Initial Investment (USD)",
+            min_value=100000,
+            max_value=50000000,
+            value=5000000,
+            step=500000,
+            format="%d"
+        )
 
-# Calculate ROI
-actual_processing = processing_capacity * (capacity_utilization / 100)
-annual_revenue = actual_processing * margin_per_mt
-operating_costs_percent = 65
-net_profit = annual_revenue * (100 - operating_costs_percent) / 100
-payback_period = investment_amount / net_profit if net_profit > 0 else 0
-annual_roi = (net_profit / investment_amount * 100) if investment_amount > 0 else 0
+    with cols[1]:
+        processing_capacity = st.number_input(
+            "Processing Capacity (MT/year)",
+            min_value=1000,
+            max_value=500000,
+            value=50000,
+            step=5000
+        )
 
-st.markdown("---")
+    with cols[2]:
+        capacity_utilization = st.slider(
+            "Expected Capacity Utilization (%)",
+            min_value=30,
+            max_value=95,
+            value=70,
+            step=5
+        )
 
-result_col1, result_col2, result_col3, result_col4 = st.columns(4)
+    with cols[3]:
+        margin_per_mt = st.number_input(
+            "Gross Margin per MT (USD)",
+            min_value=10,
+            max_value=1000,
+            value=150,
+            step=10
+        )
 
-with result_col1:
-    st.metric("Annual Processing Volume", f"{actual_processing:,.0f} MT")
+    # Calculate ROI
+    roi_result = compute_roi(investment_amount, processing_capacity,
+                             capacity_utilization, margin_per_mt)
 
-with result_col2:
-    st.metric("Estimated Annual Revenue", f"${annual_revenue:,.0f}")
+    # Write results through st.empty placeholders so each metric keeps a
+    # stable slot in the element tree and reruns patch it in place; the
+    # ROI slot simply stays empty when there is nothing to show
+    result_ph = [col.empty() for col in cols]
+    roi_ph = cols[3].empty()
 
-with result_col3:
-    st.metric("Estimated Net Profit", f"${net_profit:,.0f}")
+    result_ph[0].metric("Annual Processing Volume", roi_result['actual_str'])
+    result_ph[1].metric("Estimated Annual Revenue", roi_result['rev_str'])
+    result_ph[2].metric("Estimated Net Profit", roi_result['profit_str'])
+    result_ph[3].metric("Payback Period", roi_result['payback_str'])
+    if roi_result['roi_str'] is not None:
+        roi_ph.metric("Annual ROI", roi_result['roi_str'])
 
-with result_col4:
-    if 0 < payback_period < 20:
-        st.metric("Payback Period", f"{payback_period:.1f} years")
-        st.metric("Annual ROI", f"{annual_roi:.1f}%")
-    else:
-        st.metric("Payback Period", "Review inputs")
+    st.caption("*Simplified model for estimation only. Actual returns depend on market conditions, operational efficiency, and other factors.*")
 
-st.caption("*Simplified model for estimation only. Actual returns depend on market conditions, operational efficiency, and other factors.*")
+render_roi_calculator()
 
 st.markdown("---")
 
@@ -1003,47 +1525,11 @@ env_col1, env_col2 = st.columns(2)
 
 with env_col1:
     st.markdown("##### 🇿🇲 Zambia Investment Climate")
-    st.markdown("""
-    <div class="highlight-box">
-    <strong>Incentives & Support:</strong>
-    <ul>
-        <li><strong>Zambia Development Agency (ZDA):</strong> One-stop investment facilitation</li>
-        <li><strong>Tax Incentives:</strong> 0-5% corporate tax for 5 years in priority sectors</li>
-        <li><strong>Multi-Facility Economic Zones:</strong> Developed infrastructure for agro-processing</li>
-        <li><strong>Export Processing Zones:</strong> Duty-free inputs for export-oriented production</li>
-        <li><strong>Land Availability:</strong> Farm blocks with irrigation infrastructure</li>
-    </ul>
-    
-    <strong>Key Institutions:</strong>
-    <ul>
-        <li>Ministry of Agriculture: www.agriculture.gov.zm</li>
-        <li>Zambia Development Agency: www.zda.org.zm</li>
-        <li>Citizens Economic Empowerment Commission (CEEC): SME support</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(ZAMBIA_CLIMATE_HTML, unsafe_allow_html=True)
 
 with env_col2:
     st.markdown("##### 🇧🇼 Botswana Investment Climate")
-    st.markdown("""
-    <div class="highlight-box">
-    <strong>Incentives & Support:</strong>
-    <ul>
-        <li><strong>Botswana Investment & Trade Centre (BITC):</strong> Investment promotion</li>
-        <li><strong>Citizen Economic Empowerment:</strong> Support for local participation</li>
-        <li><strong>Special Economic Zones:</strong> Tax holidays and duty exemptions</li>
-        <li><strong>Financial Assistance Policy:</strong> Grant funding for agriculture projects</li>
-        <li><strong>Stable Economy:</strong> Strong governance and currency stability</li>
-    </ul>
-    
-    <strong>Key Institutions:</strong>
-    <ul>
-        <li>Ministry of Agriculture: www.moa.gov.bw</li>
-        <li>BITC: www.bitc.co.bw</li>
-        <li>Local Enterprise Authority (LEA): SME support</li>
-    </ul>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(BOTSWANA_CLIMATE_HTML, unsafe_allow_html=True)
 
 st.markdown("---")
 
@@ -1052,34 +1538,7 @@ st.markdown("---")
 # ============================================================
 st.subheader("🌍 Regional Market Access")
 
-st.markdown("""
-<div class="highlight-box">
-<strong>SADC Free Trade Area Benefits:</strong>
-
-Both Zambia and Botswana are members of SADC and COMESA, providing:
-
-<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-top: 15px;">
-<div>
-<strong>🎯 Market Access:</strong>
-<ul>
-    <li>300+ million consumers across SADC</li>
-    <li>Duty-free access to regional markets</li>
-    <li>Simplified customs procedures</li>
-    <li>Harmonized standards (ongoing)</li>
-</ul>
-</div>
-<div>
-<strong>🚚 Logistics Advantages:</strong>
-<ul>
-    <li>Central location in SADC</li>
-    <li>Access to multiple trade corridors</li>
-    <li>Improved road/rail infrastructure</li>
-    <li>Regional distribution hubs</li>
-</ul>
-</div>
-</div>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(SADC_MARKET_HTML, unsafe_allow_html=True)
 
 st.markdown("---")
 
@@ -1136,36 +1595,10 @@ st.markdown("---")
 footer_col1, footer_col2 = st.columns(2)
 
 with footer_col1:
-    st.markdown("""
-    #### 🎯 Ready to Invest in SADC Agriculture?
-    
-    This dashboard provides market intelligence, but successful investment requires:
-    - Detailed feasibility studies
-    - On-ground market validation
-    - Financial modeling
-    - Partner identification
-    - Regulatory compliance guidance
-    
-    **We can help with all of the above.**
-    """)
+    st.markdown(FOOTER_LEFT_MD)
 
 with footer_col2:
-    st.markdown("""
-    #### 📞 Contact Concise Analytics
-    
-    **Services:**
-    - Custom feasibility studies
-    - Market entry strategy
-    - Partner identification
-    - Due diligence support
-    - Ongoing market intelligence
-    
-    📧 **info@concise-analytics.com**  
-    🌐 **www.concise-analytics.com**  
-    📍 Gaborone, Botswana
-    
-    *Specialized data intelligence for SADC agriculture, tourism, and property markets*
-    """)
+    st.markdown(FOOTER_RIGHT_MD)
 
 st.markdown("---")
 st.caption("© 2024 Concise Data Analytics | Agriculture Dashboard v1.0 | Data as of October 2024")
@@ -1173,27 +1606,10 @@ st.caption("© 2024 Concise Data Analytics | Agriculture Dashboard v1.0 | Data a
 # ============================================================
 # DISCLAIMER
 # ============================================================
-with st.expander("⚠️ Important Disclaimer"):
-    st.markdown("""
-    **Investment Disclaimer:**
-    
-    This dashboard provides market intelligence based on publicly available data sources. 
-    All information is provided for informational purposes only and should not be construed 
-    as investment advice.
-    
-    - Production and trade data are estimates based on official statistics
-    - Processing capacity data from industry surveys and may not be comprehensive
-    - Price trends are indicative and subject to market volatility
-    - ROI calculations are simplified models and do not account for all variables
-    - Investment opportunities identified are based on market gaps and should be validated
-    
-    **Before making any investment decision:**
-    - Conduct thorough due diligence
-    - Engage local experts and legal counsel
-    - Validate all assumptions with current market data
-    - Consider political, economic, and operational risks
-    - Develop comprehensive business plans
-    
-    Concise Data Analytics provides market intelligence services but does not guarantee 
-    investment returns or market outcomes.
-    """)
+@st.fragment
+def render_disclaimer() -> None:
+    """Disclaimer expander, isolated so the page never reruns for it."""
+    with st.expander("⚠️ Important Disclaimer"):
+        st.markdown(DISCLAIMER_MD)
+
+render_disclaimer()